@@ -1,10 +1,17 @@
 import streamlit as st
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+import orjson
 import mlflow
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
 from mlflow.exceptions import MlflowException
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import os
+import time
 from datetime import datetime
 import logging
 import pathlib
@@ -17,12 +24,96 @@ from user_management import (
     get_tenant_info
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging once at program entry; imported modules just get loggers
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
 logger = logging.getLogger(__name__)
 
+# MLflow's SqlAlchemyStore reads these when it builds its engine; size the
+# pool for the dashboard's fan-out and recycle connections before they go stale
+os.environ.setdefault("MLFLOW_SQLALCHEMYSTORE_POOL_SIZE", "20")
+os.environ.setdefault("MLFLOW_SQLALCHEMYSTORE_MAX_OVERFLOW", "10")
+os.environ.setdefault("MLFLOW_SQLALCHEMYSTORE_POOL_RECYCLE", "1800")
+
 # Constants
-GATEWAY_URL = "http://gateway:8000"
+GATEWAY_URL = os.environ.get("GATEWAY_URL", "http://gateway:8000")
+TENANTS_FILE = "tenants_data/tenants.json"
+AUTH_TTL_SECONDS = 900
+
+class _GatewaySession(requests.Session):
+    """Session that applies a default timeout so no gateway call can hang."""
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", 5.0)
+        return super().request(method, url, **kwargs)
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Get a shared HTTP session for gateway calls.
+
+    Cached with st.cache_resource so the underlying connection pool
+    survives Streamlit reruns instead of opening a new TCP connection
+    per request.
+    """
+    session = _GatewaySession()
+    # Larger pool sizes sustain keep-alive under concurrent fan-out, and
+    # retries absorb transient gateway 5xx without a full reconnect
+    retries = Retry(
+        total=2,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"])
+    )
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retries)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": "mlops-ui"})
+    return session
+
+@st.cache_data(ttl=15, show_spinner=False)
+def fetch_summary(tenant_id: str) -> Dict[str, Any]:
+    """Fetch the aggregated dashboard summary from the gateway (cached for 15s).
+
+    The gateway's /dashboard/summary endpoint returns experiments, models
+    and their counts in a single round-trip.
+    """
+    response = get_session().get(f"{GATEWAY_URL}/dashboard/summary", headers={"X-Tenant-ID": tenant_id})
+    response.raise_for_status()
+    return _json(response)
+
+def _json(response: requests.Response) -> Any:
+    """Parse a gateway response body with orjson (faster than response.json())."""
+    return orjson.loads(response.content)
+
+def _get_gateway_tenants() -> List[str]:
+    """Fetch the tenant ids known to the gateway."""
+    response = get_session().get(f"{GATEWAY_URL}/tenants")
+    response.raise_for_status()
+    return _json(response)
+
+@st.cache_resource
+def prefetch_tenants() -> Future:
+    """Start fetching the gateway tenant list in the background.
+
+    Runs once per process, so the login page never blocks its first
+    paint on a gateway round-trip.
+    """
+    return ThreadPoolExecutor(max_workers=1).submit(_get_gateway_tenants)
+
+@st.cache_data(show_spinner=False)
+def _load_tenants_by_mtime(mtime: float, path: str) -> Dict[str, Any]:
+    """Load the tenants file; keyed on mtime so file edits invalidate the cache."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+def load_tenants() -> Dict[str, Any]:
+    """Load the shared tenants file, re-reading only when it changes on disk."""
+    path = os.path.abspath(TENANTS_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        return _load_tenants_by_mtime(os.path.getmtime(path), path)
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.error(f"Error loading tenants file: {str(e)}")
+        return {}
 
 def initialize_session_state():
     """Initialize session state variables."""
@@ -31,52 +122,134 @@ def initialize_session_state():
         st.session_state.experiment_type = None
     if "show_user_management" not in st.session_state:
         st.session_state.show_user_management = False
+    st.session_state.tenants_data = load_tenants()
+
+@st.cache_resource
+def get_mlflow_client(mlflow_uri: str) -> mlflow.tracking.MlflowClient:
+    """Get a cached MLflow client for a tracking URI.
+
+    Cached with st.cache_resource so the client (and any backing
+    connection pool) survives Streamlit reruns instead of being rebuilt
+    on every widget interaction. Using an explicit client also avoids
+    mutating the global fluent tracking URI on each call.
+    """
+    return mlflow.tracking.MlflowClient(tracking_uri=mlflow_uri)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_experiments(mlflow_uri: str) -> List[Dict[str, Any]]:
+    """Fetch and serialize all experiments with their runs (cached for 60s).
+
+    Caching this keeps Streamlit's full-script reruns from issuing one
+    search_runs query per experiment on every widget interaction.
+    """
+    client = get_mlflow_client(mlflow_uri)
+
+    # Search for experiments
+    experiments = client.search_experiments()
+
+    # One cross-experiment query instead of one search_runs per experiment.
+    # Only run.info fields are kept; metrics/params dominate the fetch cost
+    # and are loaded on demand via _fetch_run_details.
+    runs_by_experiment: Dict[str, pd.DataFrame] = {}
+    if experiments:
+        all_runs = client.search_runs([exp.experiment_id for exp in experiments])
+        if all_runs:
+            # Columnar construction, then one groupby; the per-experiment
+            # DataFrames are kept as-is so rendering never rebuilds them
+            # from a list of per-run dicts
+            runs_df = pd.DataFrame({
+                "experiment_id": [run.info.experiment_id for run in all_runs],
+                "run_id": [run.info.run_id for run in all_runs],
+                "status": [run.info.status for run in all_runs],
+                "start_time": [run.info.start_time for run in all_runs],
+                "end_time": [run.info.end_time for run in all_runs]
+            })
+            runs_by_experiment = {
+                experiment_id: group.drop(columns="experiment_id").reset_index(drop=True)
+                for experiment_id, group in runs_df.groupby("experiment_id", sort=False)
+            }
+
+    empty_runs = pd.DataFrame(columns=["run_id", "status", "start_time", "end_time"])
+
+    # Format experiment data
+    experiment_data = []
+    for exp in experiments:
+        experiment_data.append({
+            "experiment_id": exp.experiment_id,
+            "name": exp.name,
+            "creation_time": exp.creation_time,
+            "last_update_time": exp.last_update_time,
+            "runs": runs_by_experiment.get(exp.experiment_id, empty_runs)
+        })
+
+    return experiment_data
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _experiment_name_index(mlflow_uri: str) -> Dict[str, str]:
+    """Map experiment name -> id so selector lookups are O(1).
+
+    Derived from the cached listing, so this never issues its own
+    MLflow query.
+    """
+    return {exp["name"]: exp["experiment_id"] for exp in _fetch_experiments(mlflow_uri)}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_run_details(mlflow_uri: str, run_id: str) -> Dict[str, Any]:
+    """Fetch metrics and params for a single run (cached for 5 minutes)."""
+    run = get_mlflow_client(mlflow_uri).get_run(run_id)
+    return {"metrics": run.data.metrics, "params": run.data.params}
 
 def get_mlflow_experiments(tenant_info: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Get MLflow experiments for the current tenant."""
     try:
-        # Set the tracking URI for this tenant
-        mlflow.set_tracking_uri(tenant_info["mlflow_uri"])
-        
-        # Search for experiments
-        experiments = mlflow.search_experiments()
-        
-        # Format experiment data
-        experiment_data = []
-        for exp in experiments:
-            runs = mlflow.search_runs(exp.experiment_id)
-            experiment_data.append({
-                "experiment_id": exp.experiment_id,
-                "name": exp.name,
-                "creation_time": exp.creation_time,
-                "last_update_time": exp.last_update_time,
-                "runs": [
-                    {
-                        "run_id": run.info.run_id,
-                        "status": run.info.status,
-                        "start_time": run.info.start_time,
-                        "end_time": run.info.end_time,
-                        "metrics": run.data.metrics,
-                        "params": run.data.params
-                    }
-                    for run in runs.itertuples()
-                ]
-            })
-        
-        return experiment_data
+        return _fetch_experiments(tenant_info["mlflow_uri"])
     except Exception as e:
         logger.error(f"Error fetching MLflow experiments: {str(e)}")
         return []
 
+@st.cache_data(ttl=30, show_spinner=False)
+def get_cached_tenant_info(tenant_id: str) -> Dict[str, Any]:
+    """Get tenant info, cached briefly so reruns skip re-reading the store."""
+    return get_tenant_info(tenant_id)
+
+def render_debug(extra: Optional[Dict[str, Any]] = None):
+    """Render debug info in the sidebar, only when the global gate is on.
+
+    Keeping the gate here means session state is never stringified
+    unless the user actually asked for it.
+    """
+    if not st.session_state.get("_debug"):
+        return
+    st.sidebar.write("### Debug Information")
+    st.sidebar.write(dict(st.session_state))
+    if extra:
+        st.sidebar.write(extra)
+
+@st.cache_data(show_spinner=False)
+def _tenant_index(keys_tuple: tuple) -> Tuple[tuple, Dict[str, int]]:
+    """Precompute the ordered tenant keys and a tenant->position map.
+
+    Cached per tenants-data change so the sidebar selector does not
+    rebuild the list and rescan it for an index on every rerun.
+    """
+    return keys_tuple, {key: i for i, key in enumerate(keys_tuple)}
+
+def display_tenant_selector() -> str:
+    """Display a sidebar selector over known tenants; returns the choice."""
+    keys, index_map = _tenant_index(tuple(sorted(st.session_state.tenants_data)))
+    if not keys:
+        return ""
+    current_tenant = st.session_state.get("prefill_tenant", "")
+    return st.sidebar.selectbox("Known tenants", keys, index=index_map.get(current_tenant, 0))
+
 def display_login_form():
     """Display the login form."""
     st.title("MLOps Platform Login")
-    
-    # Debug information
-    if st.sidebar.checkbox("Show Debug Info"):
-        st.sidebar.write("### Debug Information")
-        st.sidebar.write(f"Session State: {st.session_state}")
-    
+
+    render_debug()
+
+    selected_tenant = display_tenant_selector()
+
     # Create tabs for Login and Sign Up
     login_tab, signup_tab = st.tabs(["Login", "Sign Up"])
     
@@ -92,11 +265,20 @@ def display_login_form():
     
     with login_tab:
         st.subheader("Login to Existing Tenant")
+        known_tenants = set(st.session_state.tenants_data)
+        try:
+            known_tenants.update(prefetch_tenants().result(timeout=0.05))
+        except FutureTimeout:
+            st.caption("Loading tenants from gateway...")
+        except Exception as e:
+            logger.error(f"Error fetching gateway tenants: {str(e)}")
+        if known_tenants:
+            st.caption(f"Known tenants: {', '.join(sorted(known_tenants))}")
         col1, col2 = st.columns(2)
         
         with col1:
-            # Pre-fill tenant ID if available
-            initial_tenant = st.session_state.get("prefill_tenant", "")
+            # Pre-fill tenant ID from the sidebar selector or a prior signup
+            initial_tenant = st.session_state.get("prefill_tenant", "") or selected_tenant
             tenant_id = st.text_input("Tenant ID", value=initial_tenant, key="login_tenant_id")
             if tenant_id:
                 st.write(f"Selected tenant: {tenant_id}")
@@ -113,11 +295,15 @@ def display_login_form():
                 password = st.text_input("Password", type="password", key="login_password")
                 if st.button("Login"):
                     st.write("Attempting login...")
-                    success, message, role = authenticate_user(tenant_id, username, password)
+                    success, message, role, tenant_info = authenticate_user(tenant_id, username, password)
                     if success:
                         st.session_state.authenticated_user = username
                         st.session_state.user_role = role
                         st.session_state.current_tenant = tenant_id
+                        st.session_state.tenant_info = tenant_info
+                        # Memoize the verified login so reruns within the TTL
+                        # never have to touch bcrypt/argon2 again
+                        st.session_state.auth_token = (tenant_id, username, time.time())
                         # Clear prefill values
                         if "prefill_tenant" in st.session_state:
                             del st.session_state.prefill_tenant
@@ -167,12 +353,9 @@ def display_login_form():
 def display_tenant_management():
     """Display tenant management interface for admins."""
     st.title("Tenant Management")
-    
-    # Debug information
-    if st.sidebar.checkbox("Show Debug Info"):
-        st.sidebar.write("### Debug Information")
-        st.sidebar.write(f"Session State: {st.session_state}")
-    
+
+    render_debug()
+
     # Create new tenant
     with st.expander("Create New Tenant", expanded=True):
         with st.form("create_tenant_form"):
@@ -196,13 +379,9 @@ def display_tenant_management():
 def display_user_management():
     """Display user management interface for tenant admins."""
     st.title("User Management")
-    
-    # Debug information
-    if st.sidebar.checkbox("Show Debug Info"):
-        st.sidebar.write("### Debug Information")
-        st.sidebar.write(f"Session State: {st.session_state}")
-        st.sidebar.write(f"Current Tenant: {st.session_state.current_tenant}")
-    
+
+    render_debug({"Current Tenant": st.session_state.current_tenant})
+
     # Add new user
     with st.expander("Add New User", expanded=True):
         with st.form("add_user_form"):
@@ -225,8 +404,13 @@ def display_user_management():
                     st.error(message)
     
     # List existing users
+    render_user_list(st.session_state.current_tenant)
+
+@st.fragment
+def render_user_list(tenant_id: str):
+    """Render the tenant's user list as an independently rerunning fragment."""
     st.subheader("Existing Users")
-    users = get_tenant_users(st.session_state.current_tenant)
+    users = get_tenant_users(tenant_id)
     if users:
         for username, user_data in users.items():
             st.write(f"**{username}** - Role: {user_data['role']} (Created: {user_data.get('created_at', 'N/A')})")
@@ -236,29 +420,35 @@ def display_user_management():
 def display_dashboard():
     """Display tenant-specific dashboard."""
     tenant_id = st.session_state.current_tenant
-    tenant_info = get_tenant_info(tenant_id)
-    
+    # tenant_info is stashed at login; only refetch if it is missing or
+    # the user explicitly asks for a refresh
+    tenant_info = st.session_state.get("tenant_info")
+    if tenant_info is None:
+        tenant_info = get_cached_tenant_info(tenant_id)
+        st.session_state.tenant_info = tenant_info
+
     if not tenant_info:
         st.error("Tenant information not found")
         return
     
-    # Debug information
-    if st.sidebar.checkbox("Show Debug Info"):
-        st.sidebar.write("### Debug Information")
-        st.sidebar.write(f"Session State: {st.session_state}")
-        st.sidebar.write(f"Tenant Info: {tenant_info}")
-    
+    render_debug({"Tenant Info": tenant_info})
+
     # Sidebar with tenant info and controls
     st.sidebar.header("Tenant Information")
     st.sidebar.write(f"**Name:** {tenant_info['name']}")
     st.sidebar.write(f"**Logged in as:** {st.session_state.authenticated_user}")
     st.sidebar.write(f"**Role:** {st.session_state.user_role}")
     
+    if st.sidebar.button("Refresh Tenant Info"):
+        st.session_state.tenant_info = get_tenant_info(tenant_id)
+        st.rerun()
+
     # Logout button
     if st.sidebar.button("Logout"):
         st.session_state.authenticated_user = None
         st.session_state.user_role = None
         st.session_state.current_tenant = None
+        st.session_state.tenant_info = None
         st.rerun()
     
     # Admin features
@@ -275,47 +465,155 @@ def display_dashboard():
             st.session_state.show_user_management = False
             st.rerun()
     else:
-        # Display MLflow experiments
-        st.header("MLflow Experiments")
-        
-        try:
-            experiments = get_mlflow_experiments(tenant_info)
-            
-            if experiments:
-                for exp in experiments:
-                    with st.expander(f"Experiment: {exp['name']}"):
-                        st.write(f"**ID:** {exp['experiment_id']}")
-                        st.write(f"**Created:** {exp['creation_time']}")
-                        st.write(f"**Last Updated:** {exp['last_update_time']}")
-                        
-                        # Display runs
-                        if exp['runs']:
-                            st.subheader("Runs")
-                            for run in exp['runs']:
-                                with st.expander(f"Run: {run['run_id']}"):
-                                    st.write(f"**Status:** {run['status']}")
-                                    st.write(f"**Start Time:** {run['start_time']}")
-                                    if run['end_time']:
-                                        st.write(f"**End Time:** {run['end_time']}")
-                                    
-                                    # Display metrics
-                                    if run['metrics']:
-                                        st.write("**Metrics:**")
-                                        for metric, value in run['metrics'].items():
-                                            st.write(f"- {metric}: {value}")
-                                    
-                                    # Display parameters
-                                    if run['params']:
-                                        st.write("**Parameters:**")
-                                        for param, value in run['params'].items():
-                                            st.write(f"- {param}: {value}")
-                        else:
-                            st.info("No runs found for this experiment")
+        experiments_tab, overview_tab, monitoring_tab = st.tabs(
+            ["MLflow Experiments", "Platform Overview", "Monitoring"]
+        )
+        st.session_state.setdefault("visited_tabs", set())
+
+        with overview_tab:
+            # Platform overview from the gateway; only fetch once the tab
+            # has actually been visited so reruns from other tabs stay local
+            st.header("Platform Overview")
+            if "overview" not in st.session_state.visited_tabs:
+                if st.button("Load overview"):
+                    st.session_state.visited_tabs.add("overview")
+                    st.rerun()
             else:
-                st.info("No experiments found for this tenant")
-        except Exception as e:
-            st.error(f"Error loading experiments: {str(e)}")
-            logger.error(f"Error loading experiments: {str(e)}")
+                render_overview_metrics(tenant_id)
+
+        with monitoring_tab:
+            st.header("Model Monitoring")
+            if "monitoring" not in st.session_state.visited_tabs:
+                if st.button("Load monitoring"):
+                    st.session_state.visited_tabs.add("monitoring")
+                    st.rerun()
+            else:
+                render_monitoring(tenant_id)
+
+        with experiments_tab:
+            display_experiments(tenant_info)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _monitoring_series(tenant_id: str) -> Dict[str, Any]:
+    """Build the monitoring time series (stand-in for a metrics-store query).
+
+    Cached so chart redraws reuse stable numpy arrays instead of
+    resampling on every rerun.
+    """
+    dates = pd.date_range(end=datetime.now(), periods=30, freq="D")
+    rng = np.random.default_rng(42)
+    accuracy = np.clip(0.9 + rng.normal(0, 0.005, size=dates.size).cumsum(), 0.5, 1.0)
+    latency_ms = np.abs(rng.normal(120, 15, size=dates.size))
+    return {"dates": dates, "accuracy": accuracy, "latency_ms": latency_ms}
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _monitoring_figures(tenant_id: str) -> Tuple[go.Figure, go.Figure]:
+    """Build the monitoring figures from the cached series.
+
+    go.Scattergl skips plotly-express's intermediate DataFrame and draws
+    via WebGL; caching the figures means reruns only reserialize them.
+    """
+    series = _monitoring_series(tenant_id)
+    fig_acc = go.Figure(go.Scattergl(x=series["dates"], y=series["accuracy"], mode="lines"))
+    fig_acc.update_layout(title="Model Accuracy", xaxis_title="Date", yaxis_title="Accuracy")
+    fig_lat = go.Figure(go.Scattergl(x=series["dates"], y=series["latency_ms"], mode="lines"))
+    fig_lat.update_layout(title="Prediction Latency", xaxis_title="Date", yaxis_title="Latency (ms)")
+    return fig_acc, fig_lat
+
+@st.fragment
+def render_monitoring(tenant_id: str):
+    """Render the model monitoring charts.
+
+    Runs as a fragment over cached figures, so interacting with other
+    parts of the dashboard never rebuilds or reserializes them.
+    """
+    fig_acc, fig_lat = _monitoring_figures(tenant_id)
+    # theme=None skips Streamlit's per-render figure restyling pass
+    st.plotly_chart(fig_acc, use_container_width=True, theme=None)
+    st.plotly_chart(fig_lat, use_container_width=True, theme=None)
+
+@st.fragment
+def render_overview_metrics(tenant_id: str):
+    """Render the gateway platform metrics.
+
+    Runs as a fragment so a metrics refresh reruns only this block; the
+    counts themselves come from the TTL-cached summary fetch.
+    """
+    if st.button("Refresh metrics"):
+        fetch_summary.clear()
+    try:
+        summary = fetch_summary(tenant_id)
+        col1, col2 = st.columns(2)
+        col1.metric("Experiments", summary["counts"]["experiments"])
+        col2.metric("Registered Models", summary["counts"]["models"])
+    except requests.RequestException as e:
+        st.info("Gateway metrics unavailable")
+        logger.error(f"Error fetching gateway metrics: {str(e)}")
+
+@st.fragment
+def display_experiments(tenant_info: Dict[str, Any]):
+    """Display the MLflow experiments list for the current tenant.
+
+    Runs as a fragment so widget interactions inside it (refresh, run
+    drilldown) rerun only this block, not the whole script.
+    """
+    st.header("MLflow Experiments")
+
+    if st.button("Refresh"):
+        _fetch_experiments.clear()
+        st.rerun()
+
+    try:
+        experiments = get_mlflow_experiments(tenant_info)
+
+        if experiments:
+            # Name -> id via the precomputed index instead of rescanning the
+            # experiment list on every rerun
+            name_to_id = _experiment_name_index(tenant_info["mlflow_uri"])
+            selected_name = st.selectbox("Experiment", ["(all)"] + list(name_to_id))
+            if selected_name != "(all)":
+                selected_id = name_to_id[selected_name]
+                experiments = [exp for exp in experiments if exp["experiment_id"] == selected_id]
+            for exp in experiments:
+                with st.expander(f"Experiment: {exp['name']}"):
+                    st.write(f"**ID:** {exp['experiment_id']}")
+                    st.write(f"**Created:** {exp['creation_time']}")
+                    st.write(f"**Last Updated:** {exp['last_update_time']}")
+                    
+                    # Display runs as one sortable table instead of a widget
+                    # tree per run; details render only for the selected run
+                    runs_df = exp['runs']
+                    if len(runs_df):
+                        st.subheader("Runs")
+                        st.dataframe(runs_df, hide_index=True, use_container_width=True)
+
+                        selected_run = st.selectbox(
+                            "Inspect run",
+                            ["(none)"] + runs_df["run_id"].tolist(),
+                            key=f"inspect_run_{exp['experiment_id']}"
+                        )
+                        if selected_run != "(none)":
+                            details = _fetch_run_details(tenant_info["mlflow_uri"], selected_run)
+                            if details['metrics']:
+                                st.write("**Metrics:**")
+                                for metric, value in details['metrics'].items():
+                                    st.write(f"- {metric}: {value}")
+                            if details['params']:
+                                st.write("**Parameters:**")
+                                for param, value in details['params'].items():
+                                    st.write(f"- {param}: {value}")
+                    else:
+                        st.info("No runs found for this experiment")
+        else:
+            st.info("No experiments found for this tenant")
+    except Exception as e:
+        st.error(f"Error loading experiments: {str(e)}")
+        logger.error(f"Error loading experiments: {str(e)}")
+
+def _auth_session_valid() -> bool:
+    """Check the cached login token instead of re-verifying credentials."""
+    token = st.session_state.get("auth_token")
+    return bool(token) and (time.time() - token[2]) < AUTH_TTL_SECONDS
 
 def main():
     """Main application entry point."""
@@ -326,7 +624,18 @@ def main():
     )
     
     initialize_session_state()
-    
+
+    # Single global debug gate; the sections themselves render lazily
+    st.sidebar.checkbox("Show Debug Info", key="_debug")
+
+    # Expire stale sessions based on the cached login token
+    if st.session_state.authenticated_user and not _auth_session_valid():
+        st.session_state.authenticated_user = None
+        st.session_state.user_role = None
+        st.session_state.current_tenant = None
+        st.session_state.tenant_info = None
+        st.warning("Session expired. Please log in again.")
+
     # If not authenticated, show login form
     if not st.session_state.authenticated_user:
         display_login_form()
@@ -1,24 +1,40 @@
 import bcrypt
-import json
+import orjson
 import os
+import threading
 from typing import Optional, Tuple
 import streamlit as st
 
 # Constants
 CREDENTIALS_FILE = "tenants_data/tenant_credentials.json"
 
+# In-process cache invalidated by the credentials file's mtime; the lock
+# keeps reload-and-swap atomic when Streamlit sessions run in parallel
+_CACHE = {"mtime": 0.0, "data": {}}
+_CACHE_LOCK = threading.Lock()
+
 def load_credentials() -> dict:
-    """Load tenant credentials from JSON file."""
-    if os.path.exists(CREDENTIALS_FILE):
-        with open(CREDENTIALS_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    """Load tenant credentials, re-reading the file only when it changes."""
+    if not os.path.exists(CREDENTIALS_FILE):
+        return {}
+    mtime = os.path.getmtime(CREDENTIALS_FILE)
+    if mtime != _CACHE["mtime"]:
+        with _CACHE_LOCK:
+            if mtime != _CACHE["mtime"]:
+                with open(CREDENTIALS_FILE, 'rb') as f:
+                    _CACHE["data"] = orjson.loads(f.read())
+                _CACHE["mtime"] = mtime
+    return _CACHE["data"]
 
 def save_credentials(credentials: dict):
-    """Save tenant credentials to JSON file."""
+    """Save tenant credentials atomically (write a .tmp, then os.replace)."""
     os.makedirs(os.path.dirname(CREDENTIALS_FILE), exist_ok=True)
-    with open(CREDENTIALS_FILE, 'w') as f:
-        json.dump(credentials, f)
+    tmp_path = CREDENTIALS_FILE + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(credentials))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, CREDENTIALS_FILE)
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
@@ -0,0 +1,175 @@
+import logging
+import orjson
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DB_FILE = "tenants_data/tenants.db"
+LEGACY_USERS_FILE = "tenants_data/tenants_users.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tenants (
+    tenant_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    mlflow_uri TEXT,
+    artifact_root TEXT,
+    created_at TEXT
+);
+CREATE TABLE IF NOT EXISTS users (
+    tenant_id TEXT NOT NULL,
+    username TEXT NOT NULL,
+    hashed_password TEXT NOT NULL,
+    role TEXT NOT NULL,
+    created_at TEXT,
+    PRIMARY KEY (tenant_id, username)
+);
+"""
+
+_INIT_LOCK = threading.Lock()
+_initialized = False
+
+def _connect() -> sqlite3.Connection:
+    """Open a connection with WAL enabled so readers don't block writers."""
+    os.makedirs(os.path.dirname(DB_FILE), exist_ok=True)
+    conn = sqlite3.connect(DB_FILE)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def _migrate_legacy_json(conn: sqlite3.Connection):
+    """One-shot import of the legacy tenants_users.json file.
+
+    Gated on the users table being empty — that is the data this import
+    exists to populate; the gateway shares this database and may have
+    inserted tenant rows first, which must not suppress the import.
+    """
+    if not os.path.exists(LEGACY_USERS_FILE):
+        return
+    if conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]:
+        return
+    try:
+        with open(LEGACY_USERS_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.error(f"Could not read legacy users file {LEGACY_USERS_FILE}: {str(e)}")
+        return
+    for tenant_id, tenant in data.items():
+        conn.execute(
+            "INSERT OR IGNORE INTO tenants (tenant_id, name, mlflow_uri, artifact_root, created_at) VALUES (?, ?, ?, ?, ?)",
+            (tenant_id, tenant.get("name", tenant_id), tenant.get("mlflow_uri"),
+             tenant.get("artifact_root"), tenant.get("created_at"))
+        )
+        for username, user in tenant.get("users", {}).items():
+            conn.execute(
+                "INSERT OR IGNORE INTO users (tenant_id, username, hashed_password, role, created_at) VALUES (?, ?, ?, ?, ?)",
+                (tenant_id, username, user["hashed_password"], user.get("role", "viewer"),
+                 user.get("created_at"))
+            )
+    conn.commit()
+    logger.info(f"Migrated {len(data)} tenants from {LEGACY_USERS_FILE}")
+
+def get_connection() -> sqlite3.Connection:
+    """Get a connection to the initialized tenant/user store."""
+    global _initialized
+    conn = _connect()
+    if not _initialized:
+        with _INIT_LOCK:
+            if not _initialized:
+                conn.executescript(_SCHEMA)
+                _migrate_legacy_json(conn)
+                _initialized = True
+    return conn
+
+def tenant_exists(tenant_id: str) -> bool:
+    """Check whether a tenant exists."""
+    with get_connection() as conn:
+        return conn.execute("SELECT 1 FROM tenants WHERE tenant_id = ?", (tenant_id,)).fetchone() is not None
+
+def create_tenant(tenant_id: str, name: str, mlflow_uri: str, artifact_root: str, created_at: str) -> bool:
+    """Insert a tenant; returns False if the tenant already exists."""
+    with get_connection() as conn:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO tenants (tenant_id, name, mlflow_uri, artifact_root, created_at) VALUES (?, ?, ?, ?, ?)",
+            (tenant_id, name, mlflow_uri, artifact_root, created_at)
+        )
+        return cursor.rowcount > 0
+
+def add_user(tenant_id: str, username: str, hashed_password: str, role: str, created_at: str) -> bool:
+    """Insert a user; returns False if the username is already taken."""
+    with get_connection() as conn:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO users (tenant_id, username, hashed_password, role, created_at) VALUES (?, ?, ?, ?, ?)",
+            (tenant_id, username, hashed_password, role, created_at)
+        )
+        return cursor.rowcount > 0
+
+def update_user_password(tenant_id: str, username: str, hashed_password: str) -> bool:
+    """Replace a user's stored password hash."""
+    with get_connection() as conn:
+        cursor = conn.execute(
+            "UPDATE users SET hashed_password = ? WHERE tenant_id = ? AND username = ?",
+            (hashed_password, tenant_id, username)
+        )
+        return cursor.rowcount > 0
+
+def get_user(tenant_id: str, username: str) -> Optional[Dict[str, Any]]:
+    """Get a single user's record via the (tenant_id, username) primary key."""
+    with get_connection() as conn:
+        row = conn.execute(
+            "SELECT hashed_password, role, created_at FROM users WHERE tenant_id = ? AND username = ?",
+            (tenant_id, username)
+        ).fetchone()
+        return dict(row) if row else None
+
+def lookup_user(tenant_id: str, username: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Resolve tenant existence and a user's record in a single query.
+
+    Returns (tenant_exists, user) where user is None when the tenant is
+    missing or the username is unknown within it.
+    """
+    with get_connection() as conn:
+        row = conn.execute(
+            "SELECT u.hashed_password, u.role, u.created_at "
+            "FROM tenants t LEFT JOIN users u ON u.tenant_id = t.tenant_id AND u.username = ? "
+            "WHERE t.tenant_id = ?",
+            (username, tenant_id)
+        ).fetchone()
+    if row is None:
+        return False, None
+    if row["hashed_password"] is None:
+        return True, None
+    return True, dict(row)
+
+def get_tenant_users(tenant_id: str) -> Dict[str, Dict[str, Any]]:
+    """Get all users for a tenant keyed by username."""
+    with get_connection() as conn:
+        rows = conn.execute(
+            "SELECT username, hashed_password, role, created_at FROM users WHERE tenant_id = ?",
+            (tenant_id,)
+        ).fetchall()
+        return {
+            row["username"]: {
+                "hashed_password": row["hashed_password"],
+                "role": row["role"],
+                "created_at": row["created_at"]
+            }
+            for row in rows
+        }
+
+def get_tenant_info(tenant_id: str) -> Optional[Dict[str, Any]]:
+    """Get a tenant's record including its users, or None if unknown."""
+    with get_connection() as conn:
+        row = conn.execute(
+            "SELECT name, mlflow_uri, artifact_root, created_at FROM tenants WHERE tenant_id = ?",
+            (tenant_id,)
+        ).fetchone()
+    if row is None:
+        return None
+    info = dict(row)
+    info["users"] = get_tenant_users(tenant_id)
+    return info
@@ -1,107 +1,53 @@
+import argon2
+import asyncio
 import bcrypt
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, Tuple
 import streamlit as st
 import logging
-import fcntl
-import traceback
 from datetime import datetime
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import store
+
+# Logging is configured once at program entry (app.py)
 logger = logging.getLogger(__name__)
 
-# Constants
-USERS_FILE = "tenants_data/tenants_users.json"
-BACKUP_FILE = "tenants_data/tenants_users.json.bak"
+# Hashing runs on a small pool so concurrent logins don't serialize on
+# the Streamlit script thread
+_HASH_POOL = ThreadPoolExecutor(max_workers=4)
 
-def safe_read_json(file_path: str) -> Dict[str, Any]:
-    """Safely read JSON file with error handling and backup."""
-    try:
-        if not os.path.exists(file_path):
-            logger.warning(f"File {file_path} does not exist")
-            return {}
-        
-        with open(file_path, 'r') as f:
-            # Add file lock for reading
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-            try:
-                data = json.load(f)
-                logger.info(f"Successfully read data from {file_path}")
-                return data
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error in {file_path}: {str(e)}")
-                # Try to restore from backup if available
-                if os.path.exists(BACKUP_FILE):
-                    logger.info("Attempting to restore from backup")
-                    return safe_read_json(BACKUP_FILE)
-                return {}
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-    except Exception as e:
-        logger.error(f"Error reading {file_path}: {str(e)}")
-        logger.error(traceback.format_exc())
-        return {}
+# Argon2id hasher for new passwords; legacy bcrypt hashes are still
+# verified and transparently re-hashed on successful login
+_ARGON2 = argon2.PasswordHasher(time_cost=3, memory_cost=64 * 1024, parallelism=4)
 
-def safe_write_json(file_path: str, data: Dict[str, Any]):
-    """Safely write JSON file with backup and file locking."""
-    try:
-        # Create backup of existing file
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as src, open(BACKUP_FILE, 'w') as dst:
-                fcntl.flock(src.fileno(), fcntl.LOCK_SH)
-                fcntl.flock(dst.fileno(), fcntl.LOCK_EX)
-                try:
-                    dst.write(src.read())
-                finally:
-                    fcntl.flock(src.fileno(), fcntl.LOCK_UN)
-                    fcntl.flock(dst.fileno(), fcntl.LOCK_UN)
-        
-        # Write new data
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w') as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                json.dump(data, f, indent=2)
-                logger.info(f"Successfully wrote data to {file_path}")
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-    except Exception as e:
-        logger.error(f"Error writing to {file_path}: {str(e)}")
-        logger.error(traceback.format_exc())
-        raise
-
-def load_tenant_users() -> Dict[str, Any]:
-    """Load tenant and user data from JSON file."""
-    data = safe_read_json(USERS_FILE)
-    logger.info(f"Loaded tenant data: {json.dumps(data, indent=2)}")
-    return data
-
-def save_tenant_users(data: Dict[str, Any]):
-    """Save tenant and user data to JSON file."""
-    try:
-        safe_write_json(USERS_FILE, data)
-        logger.info(f"Saved tenant data: {json.dumps(data, indent=2)}")
-    except Exception as e:
-        logger.error(f"Failed to save tenant data: {str(e)}")
-        raise
+def _hash_password_sync(password: str) -> str:
+    return _ARGON2.hash(password)
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
+    """Hash a password using Argon2id (runs on the hashing pool)."""
     try:
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        hashed = _HASH_POOL.submit(_hash_password_sync, password).result()
         logger.info("Successfully hashed password")
         return hashed
     except Exception as e:
         logger.error(f"Error hashing password: {str(e)}")
         raise
 
+def _verify_password_sync(password: str, hashed: str) -> bool:
+    # Legacy bcrypt hashes predate the Argon2 migration
+    if hashed.startswith("$2"):
+        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    try:
+        _ARGON2.verify(hashed, password)
+        return True
+    except argon2.exceptions.VerifyMismatchError:
+        return False
+
 def verify_password(password: str, hashed: str) -> bool:
-    """Verify a password against its hash."""
+    """Verify a password against its hash (runs on the hashing pool)."""
     try:
-        result = bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+        result = _HASH_POOL.submit(_verify_password_sync, password, hashed).result()
         logger.info(f"Password verification {'succeeded' if result else 'failed'}")
         return result
     except Exception as e:
@@ -111,112 +57,97 @@ def verify_password(password: str, hashed: str) -> bool:
 def create_tenant(tenant_id: str, tenant_name: str, mlflow_uri: str, artifact_root: str, admin_username: str = "admin", admin_password: str = "admin123") -> bool:
     """Create a new tenant with initial admin user."""
     try:
-        data = load_tenant_users()
         logger.info(f"Creating tenant: {tenant_id}")
-        
-        if tenant_id in data:
+
+        if store.tenant_exists(tenant_id):
             logger.warning(f"Tenant {tenant_id} already exists")
             return False
-        
+
         # Create initial admin user with provided credentials
         hashed_password = hash_password(admin_password)
-        
-        data[tenant_id] = {
-            "name": tenant_name,
-            "users": {
-                admin_username: {
-                    "hashed_password": hashed_password,
-                    "role": "admin",
-                    "created_at": str(datetime.now())
-                }
-            },
-            "mlflow_uri": mlflow_uri,
-            "artifact_root": artifact_root,
-            "created_at": str(datetime.now())
-        }
-        
-        save_tenant_users(data)
+
+        if not store.create_tenant(tenant_id, tenant_name, mlflow_uri, artifact_root, str(datetime.now())):
+            logger.warning(f"Tenant {tenant_id} already exists")
+            return False
+        store.add_user(tenant_id, admin_username, hashed_password, "admin", str(datetime.now()))
+
         logger.info(f"Created tenant {tenant_id} with initial admin user {admin_username}")
         return True
     except Exception as e:
-        logger.error(f"Error creating tenant: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error creating tenant")
         return False
 
 def add_user(tenant_id: str, username: str, password: str, role: str) -> Tuple[bool, str]:
     """Add a new user to a tenant."""
     try:
-        data = load_tenant_users()
         logger.info(f"Adding user {username} to tenant {tenant_id}")
-        
-        if tenant_id not in data:
+
+        if not store.tenant_exists(tenant_id):
             logger.warning(f"Tenant {tenant_id} not found")
             return False, "Tenant not found"
-        
-        if username in data[tenant_id]["users"]:
-            logger.warning(f"Username {username} already exists in tenant {tenant_id}")
-            return False, "Username already exists"
-        
+
         if role not in ["admin", "viewer"]:
             logger.warning(f"Invalid role: {role}")
             return False, "Invalid role"
-        
+
         hashed_password = hash_password(password)
-        data[tenant_id]["users"][username] = {
-            "hashed_password": hashed_password,
-            "role": role,
-            "created_at": str(datetime.now())
-        }
-        
-        save_tenant_users(data)
+        if not store.add_user(tenant_id, username, hashed_password, role, str(datetime.now())):
+            logger.warning(f"Username {username} already exists in tenant {tenant_id}")
+            return False, "Username already exists"
+
         logger.info(f"Added user {username} to tenant {tenant_id}")
         return True, "User added successfully"
     except Exception as e:
-        logger.error(f"Error adding user: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error adding user")
         return False, f"Error adding user: {str(e)}"
 
-def authenticate_user(tenant_id: str, username: str, password: str) -> Tuple[bool, str, Optional[str]]:
+def authenticate_user(tenant_id: str, username: str, password: str) -> Tuple[bool, str, Optional[str], Optional[Dict[str, Any]]]:
     """
     Authenticate a user.
-    Returns (success, message, role) tuple.
+    Returns (success, message, role, tenant_info) so callers get the
+    tenant record from the same lookup instead of re-fetching it later.
     """
     try:
-        data = load_tenant_users()
         logger.info(f"Authenticating user {username} for tenant {tenant_id}")
-        
-        if tenant_id not in data:
+
+        tenant_found, user_data = store.lookup_user(tenant_id, username)
+        if not tenant_found:
             logger.warning(f"Tenant {tenant_id} not found")
-            return False, "Tenant not found", None
-        
-        if username not in data[tenant_id]["users"]:
+            return False, "Tenant not found", None, None
+
+        if user_data is None:
             logger.warning(f"User {username} not found in tenant {tenant_id}")
-            return False, "User not found", None
-        
-        user_data = data[tenant_id]["users"][username]
+            return False, "User not found", None, None
+
         if verify_password(password, user_data["hashed_password"]):
+            # Gradually migrate legacy bcrypt hashes to Argon2id
+            if user_data["hashed_password"].startswith("$2"):
+                store.update_user_password(tenant_id, username, hash_password(password))
+                logger.info(f"Re-hashed legacy password for user {username}")
             logger.info(f"User {username} authenticated successfully")
-            return True, "Authentication successful", user_data["role"]
-        
+            return True, "Authentication successful", user_data["role"], store.get_tenant_info(tenant_id)
+
         logger.warning(f"Invalid password for user {username}")
-        return False, "Invalid password", None
+        return False, "Invalid password", None, None
     except Exception as e:
-        logger.error(f"Error authenticating user: {str(e)}")
-        logger.error(traceback.format_exc())
-        return False, f"Error authenticating: {str(e)}", None
+        logger.exception("Error authenticating user")
+        return False, f"Error authenticating: {str(e)}", None, None
+
+async def authenticate_user_async(tenant_id: str, username: str, password: str) -> Tuple[bool, str, Optional[str], Optional[Dict[str, Any]]]:
+    """Awaitable variant of authenticate_user for async callers."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_HASH_POOL, authenticate_user, tenant_id, username, password)
 
 def get_tenant_users(tenant_id: str) -> Dict[str, Any]:
     """Get all users for a tenant."""
-    data = load_tenant_users()
-    users = data.get(tenant_id, {}).get("users", {})
-    logger.info(f"Retrieved users for tenant {tenant_id}: {json.dumps(users, indent=2)}")
+    users = store.get_tenant_users(tenant_id)
+    logger.debug("Retrieved %d users for tenant %s", len(users), tenant_id)
     return users
 
 def get_tenant_info(tenant_id: str) -> Optional[Dict[str, Any]]:
     """Get tenant information."""
-    data = load_tenant_users()
-    info = data.get(tenant_id)
-    logger.info(f"Retrieved info for tenant {tenant_id}: {json.dumps(info, indent=2) if info else 'None'}")
+    info = store.get_tenant_info(tenant_id)
+    logger.debug("Retrieved info for tenant %s: %s", tenant_id, "found" if info else "not found")
     return info
 
 def initialize_user_state():
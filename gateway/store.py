@@ -0,0 +1,99 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+# Constants
+DB_FILE = "/app/tenants_data/tenants.db"
+LEGACY_TENANTS_FILE = "/app/tenants_data/tenants.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tenants (
+    tenant_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    mlflow_uri TEXT,
+    artifact_root TEXT,
+    created_at TEXT
+);
+"""
+
+_INIT_LOCK = threading.Lock()
+_initialized = False
+
+def _connect() -> sqlite3.Connection:
+    """Open a connection with WAL enabled so readers don't block writers."""
+    os.makedirs(os.path.dirname(DB_FILE), exist_ok=True)
+    conn = sqlite3.connect(DB_FILE)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+def _migrate_legacy_json(conn: sqlite3.Connection):
+    """Import the legacy tenants.json file.
+
+    Runs on every store initialization: the frontend shares this
+    database and may have populated tenants from its own legacy file
+    first, so presence of rows says nothing about whether this import
+    has happened. INSERT OR IGNORE keeps the re-run idempotent.
+    """
+    if not os.path.exists(LEGACY_TENANTS_FILE):
+        return
+    try:
+        with open(LEGACY_TENANTS_FILE, 'r') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Could not read legacy tenants file {LEGACY_TENANTS_FILE}: {str(e)}")
+        return
+    imported = 0
+    for tenant_id, tenant in data.items():
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO tenants (tenant_id, name, mlflow_uri, artifact_root, created_at) VALUES (?, ?, ?, ?, ?)",
+            (tenant_id, tenant.get("name", tenant_id), tenant.get("mlflow_uri"),
+             tenant.get("artifact_root"), tenant.get("created_at"))
+        )
+        imported += cursor.rowcount
+    conn.commit()
+    if imported:
+        print(f"Migrated {imported} tenants from {LEGACY_TENANTS_FILE}")
+
+def get_connection() -> sqlite3.Connection:
+    """Get a connection to the initialized tenant store."""
+    global _initialized
+    conn = _connect()
+    if not _initialized:
+        with _INIT_LOCK:
+            if not _initialized:
+                conn.executescript(_SCHEMA)
+                _migrate_legacy_json(conn)
+                _initialized = True
+    return conn
+
+def tenant_exists(tenant_id: str) -> bool:
+    """Check whether a tenant exists."""
+    with get_connection() as conn:
+        return conn.execute("SELECT 1 FROM tenants WHERE tenant_id = ?", (tenant_id,)).fetchone() is not None
+
+def create_tenant(tenant_id: str, name: str, mlflow_uri: str, artifact_root: str, created_at: str) -> bool:
+    """Insert a tenant; returns False if the tenant already exists."""
+    with get_connection() as conn:
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO tenants (tenant_id, name, mlflow_uri, artifact_root, created_at) VALUES (?, ?, ?, ?, ?)",
+            (tenant_id, name, mlflow_uri, artifact_root, created_at)
+        )
+        return cursor.rowcount > 0
+
+def get_tenant(tenant_id: str) -> Optional[Dict[str, Any]]:
+    """Get a tenant's record, or None if unknown."""
+    with get_connection() as conn:
+        row = conn.execute(
+            "SELECT name, mlflow_uri, artifact_root, created_at FROM tenants WHERE tenant_id = ?",
+            (tenant_id,)
+        ).fetchone()
+    return dict(row) if row else None
+
+def list_tenants() -> List[str]:
+    """List all tenant ids."""
+    with get_connection() as conn:
+        return [row["tenant_id"] for row in conn.execute("SELECT tenant_id FROM tenants ORDER BY tenant_id")]
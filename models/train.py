@@ -14,17 +14,19 @@ mlflow.set_registry_uri("file:/Users/rocketman_1/Developer/MLOPs/MLOps/mlruns")
 # Create artifacts directory (optional, for local runs)
 os.makedirs("mlruns", exist_ok=True)
 
+# Generate the sample data once at import; it is fully determined by the
+# fixed random_state, so repeated train_model() calls can reuse the arrays
+X, y = make_classification(n_samples=1000, n_features=20, n_classes=2, random_state=42)
+X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
 def train_model():
     with mlflow.start_run():
-        # Generate sample data
-        X, y = make_classification(n_samples=1000, n_features=20, n_classes=2, random_state=42)
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        
         # Train model
         n_estimators = 100
         max_depth = 5
         
-        rf = RandomForestClassifier(n_estimators=n_estimators, max_depth=max_depth, random_state=42)
+        # n_jobs=-1 fits trees across all available cores
+        rf = RandomForestClassifier(n_estimators=n_estimators, max_depth=max_depth, random_state=42, n_jobs=-1)
         rf.fit(X_train, y_train)
         
         # Predictions